@@ -1,7 +1,8 @@
 """Creates connected Inform7 rooms"""
 from typing import List, Union
-from perlin_noise import PerlinNoise
+import numpy as np
 from num2words import num2words as words
+from perlin_np import make_fbm
 
 
 def translate_value(
@@ -23,39 +24,36 @@ def translate_value(
     Returns:
         float: Mapped value
     """
-    from_span = from_max - from_min
     to_span = to_max - to_min
 
-    ret = float(value - from_min) / float(from_span)
+    if from_min == 0 and from_max == 1:
+        return float(to_min + value * to_span)
 
-    return to_min + (ret * to_span)
+    return to_min + (value - from_min) / (from_max - from_min) * to_span
 
 
 class Room:
     """Creates Inform7 room"""
 
-    def __init__(self, name, index, region):
+    __slots__ = ("_name", "index", "name", "region", "east", "north")
+
+    def __init__(self, name, ordinal, region):
         self._name = name
-        self.index = words(index).title()
-        self.name = f"{name} {words(index).title()}"
+        self.index = ordinal
+        self.name = f"{name} {ordinal}"
         self.region = region
         self.east = None
         self.north = None
 
     def __str__(self):
-        out = []
-        out.append(f"{self.name} is a room.")
-        out.append(f"The printed name is '{self._name}'.")
-
-        dirs = []
-        dirs.append(f"east of {self.east}" if self.east else None)
-        dirs.append(f"north of {self.north}" if self.north else None)
-        dirs = [d for d in dirs if d]
-
-        if len(dirs):
-            out.append(f"It is { ' and '.join(dirs)}.")
+        dirs = " and ".join(
+            f"{direction} of {room}"
+            for direction, room in (("east", self.east), ("north", self.north))
+            if room
+        )
+        location = f" It is {dirs}." if dirs else ""
 
-        return " ".join(out)
+        return f"{self.name} is a room. The printed name is '{self._name}'.{location}"
 
 
 class Terrain:
@@ -71,6 +69,7 @@ class Terrain:
         parent,
         entry_index=None,
         entry_name=None,
+        scale=1 / 64,
     ):
         self.width = width
         self.height = height
@@ -80,37 +79,46 @@ class Terrain:
         self.parent = parent
         self.entry_index = entry_index
         self.entry_name = entry_name
+        self.scale = scale
 
+        self.fbm = make_fbm(
+            seed, (2, 4, 8, 16, 32), (1, 1, 0.5, 0.25, 0.125), value_octaves=2
+        )
         self.rooms = self.build_rooms()
 
     def noise(
         self,
-        horizontal: Union[int, float] = 0.0,
-        vertical: Union[int, float] = 0.0,
-    ) -> int:
-        """Generates Perlin Noise for given coordinates
+        horizontal: np.ndarray,
+        vertical: np.ndarray,
+    ) -> np.ndarray:
+        """Generates Perlin Noise for a batch of coordinates
 
         Args:
-            horizontal (Union[int, float], optional): Horizontal offset. Defaults to 0.0.
-            vertical (Union[int, float], optional): Vertical offset. Defaults to 0.0.
+            horizontal (np.ndarray): Horizontal coordinates
+            vertical (np.ndarray): Vertical coordinates, paired with `horizontal`
+
+        Returns:
+            np.ndarray: Noise values at given coordinates
+        """
+        return self.fbm(horizontal, vertical)
+
+    def values(self) -> List[int]:
+        """Generates the region index of every room, row by row
 
         Returns:
-            int: Noise value at given coordinates
+            List[int]: Indices into the terrain regions
         """
-        noise1 = PerlinNoise(octaves=2, seed=self.seed)
-        noise2 = PerlinNoise(octaves=4, seed=self.seed)
-        noise3 = PerlinNoise(octaves=8, seed=self.seed)
-        noise4 = PerlinNoise(octaves=16, seed=self.seed)
-        noise5 = PerlinNoise(octaves=32, seed=self.seed)
+        if not self.width or not self.height:
+            return []
+
+        horizontal = (np.arange(self.width) + 0.5) * self.scale
+        vertical = (np.arange(self.height) + 0.5) * self.scale
+        horizontal, vertical = np.meshgrid(horizontal, vertical)
 
-        ret = noise1([horizontal + 1 / self.width, vertical + 1 / self.height])
-        ret += noise2([horizontal + 1 / self.width, vertical + 1 / self.height])
-        ret += noise3([horizontal + 1 / self.width, vertical + 1 / self.height]) * 0.5
-        ret += noise4([horizontal + 1 / self.width, vertical + 1 / self.height]) * 0.25
-        ret += noise5([horizontal + 1 / self.width, vertical + 1 / self.height]) * 0.125
-        ret += 0.5
+        noise = self.noise(horizontal.ravel(), vertical.ravel())
+        noise = (noise - noise.min()) / (np.ptp(noise) or 1)
 
-        return round(translate_value(ret, 0, 1, 0, len(self.regions) - 1))
+        return np.rint(noise * (len(self.regions) - 1)).astype(np.intp).tolist()
 
     def build_rooms(self)->List[Room]:
         """Generates list of Inform7 rooms
@@ -118,44 +126,48 @@ class Terrain:
         Returns:
             List[Room]: List of Rooms for the terrain
         """
-        index = 1
         out = []
+        ordinals = [words(i).title() for i in range(self.width * self.height + 1)]
+        names = [f"{self.name} {ordinal}" for ordinal in ordinals]
 
-        for height in range(self.height):
-            for width in range(self.width):
-                noise = self.noise(width, height)
-                room = Room(self.name, index, self.regions[noise])
+        for index, noise in enumerate(self.values(), start=1):
+            room = Room(self.name, ordinals[index], self.regions[noise])
 
-                if width >= 1:
-                    room.east = f"{self.name} {words(index - 1).title()}"
+            if (index - 1) % self.width:
+                room.east = names[index - 1]
 
-                if height >= 1:
-                    room.north = f"{self.name} {words(index - 5).title()}"
+            if index > self.width:
+                room.north = names[index - self.width]
 
-                if self.entry_index and index == self.entry_index:
-                    room.north = self.entry_name
+            if self.entry_index and index == self.entry_index:
+                room.north = self.entry_name
 
-                out.append(room)
-                index += 1
+            out.append(room)
 
         return out
 
     def __str__(self):
-        out = ["\n".join(str(r) for r in self.rooms)]
+        out = []
+        members = {region: [] for region in self.regions}
+
+        for room in self.rooms:
+            out.append(str(room))
+            members[room.region].append(room.name)
 
         for region in self.regions:
-            desc = [f"{region} {self.name} is a region."]
-            rooms = [room.name for room in self.rooms if room.region == region]
+            rooms = members[region]
 
             if len(rooms):
-                desc.append(f"{ ', '.join(rooms)} are in {region} {self.name}.")
-                out.append(" ".join(desc))
+                out.append(
+                    f"{region} {self.name} is a region. "
+                    f"{', '.join(rooms)} are in {region} {self.name}."
+                )
 
-        parent = [f"{self.parent} {self.name} is a region."]
         regions = ", ".join([f"{region} {self.name}" for region in self.regions])
-        parent.append(f"{regions} are in {self.parent} {self.name}.")
-
-        out.append(f"{' '.join(parent)}")
+        out.append(
+            f"{self.parent} {self.name} is a region. "
+            f"{regions} are in {self.parent} {self.name}."
+        )
 
         return "\n".join(out)
 
@@ -165,14 +177,14 @@ class Terrain:
         Returns:
             str: The test map
         """
-        out = ""
+        out = []
 
         for index, room in enumerate(self.rooms):
-            out += room.region[0]
+            out.append(room.region[0])
             if not (index + 1) % self.width:
-                out += "\n"
+                out.append("\n")
 
-        return out
+        return "".join(out)
 
 
 def main():
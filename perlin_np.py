@@ -0,0 +1,160 @@
+"""Vectorized Perlin noise"""
+from typing import Callable, Sequence, Tuple
+import numpy as np
+
+CORNERS = np.array(((0, 1, 0, 1), (0, 0, 1, 1)))
+
+
+def fade(value: np.ndarray) -> np.ndarray:
+    """Perlin's smoothing curve, 6t^5 - 15t^4 + 10t^3
+
+    Args:
+        value (np.ndarray): Offsets inside a grid cell, in [0, 1]
+
+    Returns:
+        np.ndarray: Smoothed offsets
+    """
+    return value * value * value * (value * (value * 6 - 15) + 10)
+
+
+def lerp(start: np.ndarray, end: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Linearly interpolates between two arrays
+
+    Args:
+        start (np.ndarray): Values at weight 0
+        end (np.ndarray): Values at weight 1
+        weight (np.ndarray): Interpolation weights
+
+    Returns:
+        np.ndarray: Interpolated values
+    """
+    return start + weight * (end - start)
+
+
+class Perlin:
+    """Two-dimensional gradient and value noise over whole arrays of coordinates"""
+
+    def __init__(self, seed: int):
+        # default_rng rejects negative seeds, so they get their own pool size, keeping
+        # them apart from every non-negative seed
+        rng = np.random.default_rng(
+            seed if seed >= 0 else np.random.SeedSequence(-seed, pool_size=8)
+        )
+        angles = rng.uniform(0, 2 * np.pi, 256)
+
+        self.permutation = np.tile(rng.permutation(256), 2)
+        self.gradients = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+        self.lattice = rng.uniform(-1, 1, 256)
+
+    def __call__(self, horizontal: np.ndarray, vertical: np.ndarray) -> np.ndarray:
+        """Generates gradient noise for a batch of coordinates
+
+        Args:
+            horizontal (np.ndarray): Horizontal coordinates
+            vertical (np.ndarray): Vertical coordinates, paired with `horizontal`
+
+        Returns:
+            np.ndarray: Noise values at given coordinates
+        """
+        index, offset_x, offset_y, step_x, step_y = self.corners(horizontal, vertical)
+        gradient = self.gradients[index]
+        dots = gradient[..., 0] * (offset_x - step_x) + gradient[..., 1] * (
+            offset_y - step_y
+        )
+
+        rows = lerp(dots[0::2], dots[1::2], fade(offset_x))
+
+        return lerp(rows[0], rows[1], fade(offset_y))
+
+    def value(self, horizontal: np.ndarray, vertical: np.ndarray) -> np.ndarray:
+        """Generates value noise for a batch of coordinates
+
+        Interpolates random values stored at the lattice corners, which is cheaper than
+        gradient noise and hard to tell apart in low-amplitude octaves.
+
+        Args:
+            horizontal (np.ndarray): Horizontal coordinates
+            vertical (np.ndarray): Vertical coordinates, paired with `horizontal`
+
+        Returns:
+            np.ndarray: Noise values at given coordinates
+        """
+        index, offset_x, offset_y, _, _ = self.corners(horizontal, vertical)
+        values = self.lattice[index]
+
+        rows = lerp(values[0::2], values[1::2], fade(offset_x))
+
+        return lerp(rows[0], rows[1], fade(offset_y))
+
+    def corners(
+        self, horizontal: np.ndarray, vertical: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Locates the lattice cell around each coordinate
+
+        Args:
+            horizontal (np.ndarray): Horizontal coordinates
+            vertical (np.ndarray): Vertical coordinates, paired with `horizontal`
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Hashed
+                indices of the corners (0, 0), (1, 0), (0, 1) and (1, 1), stacked
+                along a new first axis, then the horizontal and vertical offsets
+                inside the cell, then the corner steps broadcast against the indices
+        """
+        cell_x = np.floor(horizontal).astype(np.intp)
+        cell_y = np.floor(vertical).astype(np.intp)
+        offset_x = horizontal - cell_x
+        offset_y = vertical - cell_y
+        cell_x &= 255
+        cell_y &= 255
+
+        step_x, step_y = CORNERS.reshape((2, 4) + (1,) * cell_x.ndim)
+        index = self.permutation[self.permutation[cell_x + step_x] + cell_y + step_y]
+
+        return index, offset_x, offset_y, step_x, step_y
+
+
+def make_fbm(
+    seed: int,
+    frequencies: Sequence[float],
+    amplitudes: Sequence[float],
+    value_octaves: int = 0,
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Builds a fractal noise function summing several octaves of one Perlin field
+
+    Args:
+        seed (int): Noise seed
+        frequencies (Sequence[float]): Coordinate multiplier of each octave
+        amplitudes (Sequence[float]): Weight of each octave, paired with `frequencies`
+        value_octaves (int, optional): How many of the last octaves use the cheaper
+            value noise instead of gradient noise. Defaults to 0.
+
+    Returns:
+        Callable[[np.ndarray, np.ndarray], np.ndarray]: Noise function over batches of
+            horizontal and vertical coordinates
+
+    Raises:
+        ValueError: If `amplitudes` and `frequencies` differ in length, or
+            `value_octaves` is not between 0 and the number of octaves
+    """
+    if len(amplitudes) != len(frequencies):
+        raise ValueError("amplitudes and frequencies must have the same length")
+
+    if not 0 <= value_octaves <= len(frequencies):
+        raise ValueError("value_octaves must be between 0 and the number of octaves")
+
+    perlin = Perlin(seed)
+    frequencies = np.asarray(frequencies)
+    amplitudes = np.asarray(amplitudes)
+    split = len(frequencies) - value_octaves
+
+    def fbm(horizontal: np.ndarray, vertical: np.ndarray) -> np.ndarray:
+        horizontal = np.multiply.outer(frequencies, horizontal)
+        vertical = np.multiply.outer(frequencies, vertical)
+
+        gradient = perlin(horizontal[:split], vertical[:split])
+        value = perlin.value(horizontal[split:], vertical[split:])
+
+        return amplitudes[:split] @ gradient + amplitudes[split:] @ value
+
+    return fbm